@@ -1,22 +1,27 @@
 """Git Patchdance - Interactive terminal tool for git patch management."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Ronny Pfannschmidt"
 __email__ = "opensource@ronnypfannschmidt.de"
 
-from .core.models import (
-    CommitGraph,
-    CommitId,
-    CommitInfo,
-    Conflict,
-    DiffLine,
-    Hunk,
-    ModeChange,
-    Operation,
-    OperationResult,
-    Patch,
-    PatchId,
-)
+if TYPE_CHECKING:
+    from .core.models import (
+        CommitGraph,
+        CommitId,
+        CommitInfo,
+        Conflict,
+        DiffLine,
+        Hunk,
+        ModeChange,
+        Operation,
+        OperationResult,
+        Patch,
+        PatchId,
+    )
 
 __all__ = [
     "CommitId",
@@ -31,3 +36,15 @@ __all__ = [
     "Conflict",
     "CommitGraph",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve model re-exports on first access so entry points such as
+    # the CLI do not load the models module just by importing the package
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from .core import models
+
+    value = getattr(models, name)
+    globals()[name] = value
+    return value
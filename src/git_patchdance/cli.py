@@ -1,14 +1,17 @@
 """Command-line interface for Git Patchdance."""
 
+from __future__ import annotations
+
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from .core.errors import GitPatchError
-from .demo import create_demo_repository
-from .git.repository import GitRepository, open_repository
-from .tui.app import TuiApp
+
+if TYPE_CHECKING:
+    from .git.repository import GitRepository
 
 
 @click.command()
@@ -41,8 +44,15 @@ def main(path: Path, gui: bool = False, demo: bool = False) -> None:
     if not sys.stdout.isatty():
         click.echo("This application requires a terminal interface to run.", err=True)
         sys.exit(1)
+
+    # Deferred so that --help/--version never pay for GitPython and Textual
+    from .git.repository import open_repository
+    from .tui.app import TuiApp
+
     try:
         if demo:
+            from .demo import create_demo_repository
+
             click.echo("Creating demo repository with sample commits...", err=True)
             git_repository: GitRepository = create_demo_repository()
         else:
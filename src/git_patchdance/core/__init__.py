@@ -1,20 +1,44 @@
 """Core module for Git Patchdance."""
 
-from .errors import GitPatchError
-from .events import AppEvent
-from .models import (
-    CommitGraph,
-    CommitId,
-    CommitInfo,
-    Conflict,
-    DiffLine,
-    Hunk,
-    ModeChange,
-    Operation,
-    OperationResult,
-    Patch,
-    PatchId,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .errors import GitPatchError
+    from .events import AppEvent
+    from .models import (
+        CommitGraph,
+        CommitId,
+        CommitInfo,
+        Conflict,
+        DiffLine,
+        Hunk,
+        ModeChange,
+        Operation,
+        OperationResult,
+        Patch,
+        PatchId,
+    )
+
+# Re-exports resolve on first access so importing the package does not
+# load every submodule
+_LAZY_IMPORTS = {
+    "GitPatchError": "errors",
+    "AppEvent": "events",
+    "CommitId": "models",
+    "CommitInfo": "models",
+    "PatchId": "models",
+    "Patch": "models",
+    "Hunk": "models",
+    "DiffLine": "models",
+    "ModeChange": "models",
+    "Operation": "models",
+    "OperationResult": "models",
+    "Conflict": "models",
+    "CommitGraph": "models",
+}
 
 __all__ = [
     "GitPatchError",
@@ -31,3 +55,13 @@ __all__ = [
     "Conflict",
     "CommitGraph",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,28 +1,86 @@
-"""Custom exceptions for Git Patchdance."""
+"""Exception hierarchy for Git Patchdance.
+
+Exceptions keep the raw values they were raised with and only format a
+message when converted to a string, so raising and catching them stays
+cheap when the message is never displayed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .models import Conflict
 
 
 class GitPatchError(Exception):
-    """Base exception for Git Patchdance errors."""
+    """Base exception for Git Patchdance errors.
+
+    All other Git Patchdance exceptions inherit from this class, so it
+    can be used to catch any error raised by the library.
+    """
 
 
 class RepositoryNotFound(GitPatchError):
-    """Raised when a git repository cannot be found."""
+    """Raised when a git repository cannot be found.
+
+    Attributes:
+        path: The path where the repository was expected
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.path = path
+
+    def __str__(self) -> str:
+        return f"Git repository not found at: {self.path}"
 
 
 class InvalidCommitId(GitPatchError):
-    """Raised when an invalid commit ID is provided."""
+    """Raised when an invalid commit ID is provided.
+
+    Attributes:
+        commit_id: The commit ID that is malformed or does not exist
+    """
+
+    def __init__(self, commit_id: str) -> None:
+        super().__init__(commit_id)
+        self.commit_id = commit_id
+
+    def __str__(self) -> str:
+        return f"Invalid commit ID: {self.commit_id}"
 
 
 class NoCommitsFound(GitPatchError):
     """Raised when no commits are found in the repository."""
 
+    def __str__(self) -> str:
+        return "No commits found"
+
 
 class ApplicationError(GitPatchError):
     """Raised when an operation application fails."""
 
 
 class GitOperationError(GitPatchError):
-    """Raised when a git operation fails."""
+    """Raised when a git operation fails.
+
+    Attributes:
+        operation: Name of the repository operation that failed
+    """
+
+    def __init__(self, operation: str) -> None:
+        super().__init__(operation)
+        self.operation = operation
+
+    def __str__(self) -> str:
+        return f"Git operation failed: {self.operation}"
+
+
+class IoError(GitPatchError):
+    """Raised when a file system operation fails."""
 
 
 class PatchError(GitPatchError):
@@ -30,8 +88,16 @@ class PatchError(GitPatchError):
 
 
 class ConflictError(GitPatchError):
-    """Raised when conflicts occur during operations."""
+    """Raised when conflicts occur during operations.
 
-    def __init__(self, message: str, conflicts: list[str]) -> None:
-        self.conflicts = conflicts
+    Attributes:
+        conflicts: The conflicts that were detected
+    """
+
+    def __init__(self, message: str, conflicts: list[Conflict]) -> None:
         super().__init__(message)
+        self.conflicts = conflicts
+
+
+class OperationCancelled(GitPatchError):
+    """Raised when a long-running operation is cancelled by the user."""
@@ -1,74 +1,78 @@
 """Application events for Git Patchdance."""
 
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from .models import CommitId
+if TYPE_CHECKING:
+    from .models import CommitId
 
 
-@dataclass
+@dataclass(slots=True)
 class LoadRepository:
     """Event to load a repository."""
 
     path: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RefreshCommits:
     """Event to refresh the commit list."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectCommit:
     """Event to select a commit."""
 
     commit_id: CommitId
 
 
-@dataclass
+@dataclass(slots=True)
 class NavigateUp:
     """Event to navigate up in the commit list."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class NavigateDown:
     """Event to navigate down in the commit list."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Quit:
     """Event to quit the application."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowHelp:
     """Event to show help."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ShowCommitDetails:
     """Event to show detailed commit information."""
 
     commit_id: CommitId
 
 
-@dataclass
+@dataclass(slots=True)
 class ViewPatches:
     """Event to view patches for a commit."""
 
     commit_id: CommitId
 
 
-@dataclass
+@dataclass(slots=True)
 class MovePatchEvent:
     """Event to move a patch between commits."""
 
@@ -77,7 +81,7 @@ class MovePatchEvent:
     to_commit: CommitId
 
 
-@dataclass
+@dataclass(slots=True)
 class SplitCommitEvent:
     """Event to split a commit."""
 
@@ -2,26 +2,33 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from enum import Enum
+import re
+import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import TYPE_CHECKING, NewType
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
     from datetime import datetime
     from pathlib import Path, PurePath
 
 
-@dataclass(frozen=True)
-class CommitId:
-    """Represents a git commit ID/SHA."""
+CommitId = NewType("CommitId", str)
 
-    full: str
 
-    def __str__(self) -> str:
-        return self.full[:8]
+def short(commit_id: CommitId) -> str:
+    """Get the abbreviated form of a commit ID for display.
 
+    The result is interned so repeated renders of the same commit reuse
+    one string instead of slicing a new one each time.
+    """
+    return sys.intern(commit_id[:8])
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CommitInfo:
     """Information about a git commit."""
 
@@ -31,11 +38,49 @@ class CommitInfo:
     email: str
     timestamp: datetime
     parent_ids: tuple[CommitId, ...]
-    files_changed: list[str]
+    files_changed: tuple[str, ...]
+    # POSIX timestamp as a plain float, so sort keys skip datetime arithmetic
+    timestamp_epoch: float = field(init=False, repr=False, compare=False)
+    _summary: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the timestamp as seconds since the epoch."""
+        object.__setattr__(self, "timestamp_epoch", self.timestamp.timestamp())
+
+    @classmethod
+    def interned(
+        cls,
+        id: str,
+        message: str,
+        author: str,
+        email: str,
+        timestamp: datetime,
+        parent_ids: Iterable[str],
+        files_changed: Iterable[str],
+    ) -> CommitInfo:
+        """Create a CommitInfo with SHAs, identities and paths interned.
+
+        Parent SHAs, author identities and file paths repeat across a
+        commit graph, so interning them on ingest shares one string per
+        value and lets comparisons short-circuit on identity.
+        """
+        return cls(
+            id=CommitId(sys.intern(id)),
+            message=message,
+            author=sys.intern(author),
+            email=sys.intern(email),
+            timestamp=timestamp,
+            parent_ids=tuple(CommitId(sys.intern(p)) for p in parent_ids),
+            files_changed=tuple(sys.intern(path) for path in files_changed),
+        )
 
     def summary(self) -> str:
         """Get the commit message summary (first line)."""
-        return self.message.split("\n", 1)[0]
+        summary = self._summary
+        if summary is None:
+            summary = self.message.split("\n", 1)[0]
+            object.__setattr__(self, "_summary", summary)
+        return summary
 
     def is_merge(self) -> bool:
         """Check if this is a merge commit (has multiple parents)."""
@@ -45,7 +90,7 @@ class CommitInfo:
 PatchId = NewType("PatchId", str)
 
 
-class LineType(Enum):
+class LineType(StrEnum):
     """Enum representing diff line types with their 2-character prefixes."""
 
     ADDITION = "+ "
@@ -53,7 +98,23 @@ class LineType(Enum):
     CONTEXT = "  "
 
 
-@dataclass
+_PREFIX_TO_LINE_TYPE = {line_type.value: line_type for line_type in LineType}
+
+
+def _line_type(line: str) -> LineType:
+    """Get the type of a raw diff line from its 2-character prefix."""
+    if not line:
+        return LineType.CONTEXT
+
+    line_type = _PREFIX_TO_LINE_TYPE.get(line[:2])
+    if line_type is None:
+        raise ValueError(
+            f"Invalid diff line format: {line!r}. Must start with '+ ', '- ', or '  '"
+        )
+    return line_type
+
+
+@dataclass(slots=True)
 class DiffLine:
     """Represents a line in a diff."""
 
@@ -63,57 +124,120 @@ class DiffLine:
     @classmethod
     def from_diff_line(cls, line: str) -> DiffLine:
         """Create a DiffLine from a raw diff line string."""
-        if len(line) == 0:
-            return cls(content="", line_type=LineType.CONTEXT)
-
-        if line.startswith("+ "):
-            return cls(content=line[2:], line_type=LineType.ADDITION)
-        elif line.startswith("- "):
-            return cls(content=line[2:], line_type=LineType.DELETION)
-        elif line.startswith("  "):
-            return cls(content=line[2:], line_type=LineType.CONTEXT)
-        else:
-            raise ValueError(
-                f"Invalid diff line format: {line!r}. "
-                f"Must start with '+ ', '- ', or '  '"
-            )
+        return cls(content=line[2:], line_type=_line_type(line))
 
     def to_diff_line(self) -> str:
         """Convert back to raw diff line format."""
-        return self.line_type.value + self.content
+        return self.line_type + self.content
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LineRun:
     start: int
     lines: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Hunk:
-    """Represents a hunk in a diff."""
+    """Represents a hunk in a diff.
+
+    The addition, deletion and context line counts are computed from
+    ``lines`` once at construction, so views can show hunk stats without
+    rescanning lines. Hunks from a metadata-only parse have no ``lines``;
+    their counts are taken from the line prefixes while parsing.
+    """
 
     old: LineRun
     new: LineRun
     lines: list[DiffLine]
     context: str
+    additions: int = field(init=False)
+    deletions: int = field(init=False)
+    context_lines: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Count added, deleted and context lines."""
+        self._set_counts(Counter(line.line_type for line in self.lines))
+
+    def _set_counts(self, counts: Counter[LineType]) -> None:
+        self.additions = counts[LineType.ADDITION]
+        self.deletions = counts[LineType.DELETION]
+        self.context_lines = counts[LineType.CONTEXT]
+
+
+_HUNK_HEADER = re.compile(r"@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@ ?(.*)")
+
+
+def _line_run(start: str, lines: str | None) -> LineRun:
+    # An omitted line count means a single line, as in unified diffs
+    return LineRun(start=int(start), lines=1 if lines is None else int(lines))
+
+
+def parse_hunks(raw: str, *, metadata_only: bool = False) -> list[Hunk]:
+    """Parse hunks from a diff body made of ``@@`` headers and diff lines.
+
+    Args:
+        raw: Hunk headers, each followed by lines in ``DiffLine`` format
+        metadata_only: Only parse the headers and count lines by type,
+            leaving ``Hunk.lines`` empty, for views that show line runs
+            and stats but not content
+
+    Raises:
+        ValueError: If a hunk header or diff line is malformed
+    """
+    headers: list[tuple[LineRun, LineRun, str]] = []
+    bodies: list[list[DiffLine]] = []
+    # Line type counts per hunk, used when lines are not kept
+    counts: list[Counter[LineType]] = []
+    for line in raw.splitlines():
+        if line.startswith("@@"):
+            match = _HUNK_HEADER.fullmatch(line)
+            if match is None:
+                raise ValueError(f"Invalid hunk header: {line!r}")
+            old_start, old_lines, new_start, new_lines, context = match.groups()
+            headers.append(
+                (
+                    _line_run(old_start, old_lines),
+                    _line_run(new_start, new_lines),
+                    context,
+                )
+            )
+            bodies.append([])
+            if metadata_only:
+                counts.append(Counter())
+        elif not bodies:
+            raise ValueError(f"Diff line before first hunk header: {line!r}")
+        elif metadata_only:
+            counts[-1][_line_type(line)] += 1
+        else:
+            bodies[-1].append(DiffLine.from_diff_line(line))
+
+    # Hunks are built once their lines are complete so the stats are right
+    hunks = [
+        Hunk(old=old, new=new, lines=lines, context=context)
+        for (old, new, context), lines in zip(headers, bodies, strict=True)
+    ]
+    if metadata_only:
+        for hunk, hunk_counts in zip(hunks, counts, strict=True):
+            hunk._set_counts(hunk_counts)
+    return hunks
 
 
-@dataclass
+@dataclass(slots=True)
 class FileCreated:
     """Represents a newly created file."""
 
     mode: int
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDeleted:
     """Represents a deleted file."""
 
     mode: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ModeChanged:
     """Represents a file mode change."""
 
@@ -125,7 +249,7 @@ class ModeChanged:
 ModeChange = FileCreated | FileDeleted | ModeChanged
 
 
-@dataclass
+@dataclass(slots=True)
 class Patch:
     """Represents a patch (changes to a file)."""
 
@@ -136,7 +260,7 @@ class Patch:
     mode_change: ModeChange | None
 
 
-class InsertPosition(Enum):
+class InsertPosition(StrEnum):
     """Where to insert a new commit."""
 
     BEFORE = "before"
@@ -144,7 +268,7 @@ class InsertPosition(Enum):
     AT_BRANCH_HEAD = "at_branch_head"
 
 
-@dataclass
+@dataclass(slots=True)
 class NewCommit:
     """Represents a new commit to be created."""
 
@@ -153,7 +277,7 @@ class NewCommit:
     position: InsertPosition
 
 
-@dataclass
+@dataclass(slots=True)
 class MovePatch:
     """Operation to move a patch between commits."""
 
@@ -163,7 +287,7 @@ class MovePatch:
     position: InsertPosition
 
 
-@dataclass
+@dataclass(slots=True)
 class SplitCommit:
     """Operation to split a commit into multiple commits."""
 
@@ -171,7 +295,7 @@ class SplitCommit:
     new_commits: list[NewCommit]
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateCommit:
     """Operation to create a new commit."""
 
@@ -180,7 +304,7 @@ class CreateCommit:
     position: InsertPosition
 
 
-@dataclass
+@dataclass(slots=True)
 class MergeCommits:
     """Operation to merge multiple commits."""
 
@@ -192,7 +316,7 @@ class MergeCommits:
 Operation = MovePatch | SplitCommit | CreateCommit | MergeCommits
 
 
-class ConflictKind(Enum):
+class ConflictKind(StrEnum):
     """Types of conflicts that can occur."""
 
     CONTENT_CONFLICT = "content_conflict"
@@ -201,7 +325,7 @@ class ConflictKind(Enum):
     RENAME_CONFLICT = "rename_conflict"
 
 
-@dataclass
+@dataclass(slots=True)
 class Conflict:
     """Represents a conflict during an operation."""
 
@@ -213,7 +337,7 @@ class Conflict:
     their_content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationResult:
     """Result of applying an operation."""
 
@@ -224,49 +348,101 @@ class OperationResult:
     message: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CommitGraph:
     """Represents a graph of commits."""
 
     commits: list[CommitInfo]
     current_branch: str
     total_count: int | None = None
+    _index: dict[CommitId, int] = field(init=False, repr=False, compare=False)
+    # Parent edges in compressed sparse row form, built on first use: the
+    # parents of commit i are idx[ptr[i]:ptr[i + 1]] for (ptr, idx)
+    _parent_edges: tuple[array[int], array[int]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Display columns kept parallel to commits, so list views read one
+    # column per row instead of calling into each CommitInfo
+    short_ids: list[str] = field(init=False, repr=False, compare=False)
+    summaries: list[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Set total_count if not provided."""
+        """Set total_count if not provided and index commits."""
         if self.total_count is None:
             self.total_count = len(self.commits)
+        self.short_ids = [short(commit.id) for commit in self.commits]
+        self.summaries = [commit.summary() for commit in self.commits]
+        self._index = {}
+        for i, commit in enumerate(self.commits):
+            self._index.setdefault(commit.id, i)
+
+    def _get_parent_edges(self) -> tuple[array[int], array[int]]:
+        """Build the parent edge arrays once, on first traversal."""
+        if self._parent_edges is None:
+            parent_ptr = array("I", [0])
+            parent_idx = array("I")
+            for commit in self.commits:
+                for parent_id in commit.parent_ids:
+                    # Parents outside the loaded range have no index
+                    parent = self._index.get(parent_id)
+                    if parent is not None:
+                        parent_idx.append(parent)
+                parent_ptr.append(len(parent_idx))
+            self._parent_edges = (parent_ptr, parent_idx)
+        return self._parent_edges
 
     def find_commit(self, commit_id: CommitId) -> CommitInfo | None:
         """Find a commit by its ID."""
-        for commit in self.commits:
-            if commit.id == commit_id:
-                return commit
-        return None
+        index = self._index.get(commit_id)
+        return None if index is None else self.commits[index]
 
     def get_commit_index(self, commit_id: CommitId) -> int | None:
         """Get the index of a commit by its ID."""
-        for i, commit in enumerate(self.commits):
-            if commit.id == commit_id:
-                return i
-        return None
-
-
-# Type alias for file content or removal (None = removal)
-ContentOrRemoval = str | None
-
-
-@dataclass
+        return self._index.get(commit_id)
+
+    def is_ancestor(self, ancestor: CommitId, descendant: CommitId) -> bool:
+        """Check if a commit is reachable from another through its parents.
+
+        A commit counts as its own ancestor. Only commits in this graph are
+        considered, so history outside the loaded range is not followed.
+        """
+        target = self._index.get(ancestor)
+        start = self._index.get(descendant)
+        if target is None or start is None:
+            return False
+
+        parent_ptr, parent_idx = self._get_parent_edges()
+        visited = bytearray(len(self.commits))
+        visited[start] = 1
+        pending = [start]
+        while pending:
+            current = pending.pop()
+            if current == target:
+                return True
+            begin, end = parent_ptr[current], parent_ptr[current + 1]
+            for parent in parent_idx[begin:end]:
+                if not visited[parent]:
+                    visited[parent] = 1
+                    pending.append(parent)
+        return False
+
+
+# Type alias for file content or removal (None = removal); bytes are
+# written verbatim, str is encoded as UTF-8
+ContentOrRemoval = str | bytes | None
+
+
+@dataclass(slots=True)
 class CommitRequest:
     """Request to create a new commit with file operations."""
 
     message: str
     author: str
     email: str
-    file_operations: dict[PurePath, ContentOrRemoval]
+    file_operations: Mapping[PurePath, ContentOrRemoval]
     parent_ids: tuple[CommitId, ...] = ()
 
     @property
-    def files_changed(self) -> list[str]:
-        """Get list of files that will be changed."""
-        return [str(path) for path in self.file_operations]
+    def files_changed(self) -> tuple[str, ...]:
+        """Get the files that will be changed."""
+        return tuple(str(path) for path in self.file_operations)
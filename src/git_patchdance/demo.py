@@ -2,41 +2,19 @@
 
 from pathlib import PurePath
 
-from .core.models import CommitRequest
 from .git.fake_repository import FakeRepository
 
+_AUTHOR = "Demo User"
+_EMAIL = "demo@example.com"
 
-def create_demo_repository() -> FakeRepository:
-    """Create a demo repository with commits containing line runs at positions.
-
-    This function creates a series of commits that add line runs (multiple
-    consecutive lines) at different positions in files. Each commit creates
-    a new numbered file in a submodule to demonstrate patch manipulation.
-
-    Returns:
-        FakeRepository with demo commits showing various line run patterns
-    """
-    # Create empty fake repository
-    repo = FakeRepository.create_test_repository(commit_count=0)
+# Paths parsed once and shared by every demo repository; contents below
+# are stored pre-encoded as they would be written to disk
+_P_INIT = PurePath("submodule/__init__.py")
+_P_README = PurePath("README.md")
+_P_MODS = tuple(PurePath(f"submodule/module{i}.py") for i in range(1, 7))
 
-    # Initial commit: Basic structure
-    request = CommitRequest(
-        message="Initial commit: Create submodule structure",
-        author="Demo User",
-        email="demo@example.com",
-        file_operations={
-            PurePath(
-                "submodule/__init__.py"
-            ): '"""Demo submodule for patch manipulation."""\n',
-            PurePath(
-                "README.md"
-            ): "# Demo Repository\n\nDemonstrates patch manipulation.\n",
-        },
-    )
-    repo.create_commit(request)
-
-    # Commit 1: Add file with imports at top (line run at beginning)
-    file1_content = '''#!/usr/bin/env python3
+# Commit 1: Add file with imports at top (line run at beginning)
+_MODULE1 = b'''#!/usr/bin/env python3
 """Module 1: Demonstrates line runs at the beginning."""
 
 import sys
@@ -54,17 +32,8 @@ if __name__ == "__main__":
     main()
 '''
 
-    request = CommitRequest(
-        message="Add module1.py with import line run at top",
-        author="Demo User",
-        email="demo@example.com",
-        file_operations={PurePath("submodule/module1.py"): file1_content},
-        parent_ids=(repo.head_commit,) if repo.head_commit else (),
-    )
-    repo.create_commit(request)
-
-    # Commit 2: Add file with function block in middle (line run in middle)
-    file2_content = '''#!/usr/bin/env python3
+# Commit 2: Add file with function block in middle (line run in middle)
+_MODULE2 = b'''#!/usr/bin/env python3
 """Module 2: Demonstrates line runs in the middle."""
 
 import sys
@@ -89,17 +58,8 @@ if __name__ == "__main__":
     main()
 '''
 
-    request = CommitRequest(
-        message="Add module2.py with validation function in middle",
-        author="Demo User",
-        email="demo@example.com",
-        file_operations={PurePath("submodule/module2.py"): file2_content},
-        parent_ids=(repo.head_commit,) if repo.head_commit else (),
-    )
-    repo.create_commit(request)
-
-    # Commit 3: Add file with class definition (large line run)
-    file3_content = '''#!/usr/bin/env python3
+# Commit 3: Add file with class definition (large line run)
+_MODULE3 = b'''#!/usr/bin/env python3
 """Module 3: Demonstrates large line runs with class definition."""
 
 import sys
@@ -138,17 +98,8 @@ if __name__ == "__main__":
     main()
 '''
 
-    request = CommitRequest(
-        message="Add module3.py with DataProcessor class",
-        author="Demo User",
-        email="demo@example.com",
-        file_operations={PurePath("submodule/module3.py"): file3_content},
-        parent_ids=(repo.head_commit,) if repo.head_commit else (),
-    )
-    repo.create_commit(request)
-
-    # Commit 4: Add file with error handling at end (line run at end)
-    file4_content = '''#!/usr/bin/env python3
+# Commit 4: Add file with error handling at end (line run at end)
+_MODULE4 = b'''#!/usr/bin/env python3
 """Module 4: Demonstrates line runs at the end."""
 
 import sys
@@ -179,17 +130,8 @@ if __name__ == "__main__":
         sys.exit(1)
 '''
 
-    request = CommitRequest(
-        message="Add module4.py with error handling at end",
-        author="Demo User",
-        email="demo@example.com",
-        file_operations={PurePath("submodule/module4.py"): file4_content},
-        parent_ids=(repo.head_commit,) if repo.head_commit else (),
-    )
-    repo.create_commit(request)
-
-    # Commit 5: Add file with configuration block after imports
-    file5_content = '''#!/usr/bin/env python3
+# Commit 5: Add file with configuration block after imports
+_MODULE5 = b'''#!/usr/bin/env python3
 """Module 5: Demonstrates line runs with configuration."""
 
 import sys
@@ -222,17 +164,8 @@ if __name__ == "__main__":
     main()
 '''
 
-    request = CommitRequest(
-        message="Add module5.py with configuration constants",
-        author="Demo User",
-        email="demo@example.com",
-        file_operations={PurePath("submodule/module5.py"): file5_content},
-        parent_ids=(repo.head_commit,) if repo.head_commit else (),
-    )
-    repo.create_commit(request)
-
-    # Commit 6: Add file with mixed line runs at different positions
-    file6_content = '''#!/usr/bin/env python3
+# Commit 6: Add file with mixed line runs at different positions
+_MODULE6 = b'''#!/usr/bin/env python3
 """Module 6: Demonstrates mixed line run patterns."""
 
 # Multiple imports at top
@@ -288,13 +221,56 @@ if __name__ == "__main__":
         sys.exit(1)
 '''
 
-    request = CommitRequest(
-        message="Add module6.py with mixed line run patterns",
-        author="Demo User",
-        email="demo@example.com",
-        file_operations={PurePath("submodule/module6.py"): file6_content},
-        parent_ids=(repo.head_commit,) if repo.head_commit else (),
+# Demo commits, oldest first, as (message, ((path, content), ...))
+_DEMO_COMMITS: tuple[tuple[str, tuple[tuple[PurePath, bytes], ...]], ...] = (
+    (
+        "Initial commit: Create submodule structure",
+        (
+            (_P_INIT, b'"""Demo submodule for patch manipulation."""\n'),
+            (_P_README, b"# Demo Repository\n\nDemonstrates patch manipulation.\n"),
+        ),
+    ),
+    (
+        "Add module1.py with import line run at top",
+        ((_P_MODS[0], _MODULE1),),
+    ),
+    (
+        "Add module2.py with validation function in middle",
+        ((_P_MODS[1], _MODULE2),),
+    ),
+    ("Add module3.py with DataProcessor class", ((_P_MODS[2], _MODULE3),)),
+    (
+        "Add module4.py with error handling at end",
+        ((_P_MODS[3], _MODULE4),),
+    ),
+    (
+        "Add module5.py with configuration constants",
+        ((_P_MODS[4], _MODULE5),),
+    ),
+    (
+        "Add module6.py with mixed line run patterns",
+        ((_P_MODS[5], _MODULE6),),
+    ),
+)
+
+
+def create_demo_repository() -> FakeRepository:
+    """Create a demo repository with commits containing line runs at positions.
+
+    This function creates a series of commits that add line runs (multiple
+    consecutive lines) at different positions in files. Each commit creates
+    a new numbered file in a submodule to demonstrate patch manipulation.
+
+    Returns:
+        FakeRepository with demo commits showing various line run patterns
+    """
+    # Create empty fake repository
+    repo = FakeRepository.create_test_repository(commit_count=0)
+
+    repo.create_commits_bulk(
+        ((message, dict(files)) for message, files in _DEMO_COMMITS),
+        author=_AUTHOR,
+        email=_EMAIL,
     )
-    repo.create_commit(request)
 
     return repo
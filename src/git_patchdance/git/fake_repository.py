@@ -1,11 +1,30 @@
 """In-memory fake implementation of GitRepository for testing."""
 
-from datetime import UTC, datetime
-from pathlib import Path
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from datetime import UTC, datetime, timedelta
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING
 
 from ..core.errors import InvalidCommitId, NoCommitsFound
 from ..core.models import CommitGraph, CommitId, CommitInfo, CommitRequest
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from ..core.models import ContentOrRemoval
+
+
+# Commits created in an empty fake repository start at this time
+_CLOCK_START = datetime(2024, 1, 1, tzinfo=UTC)
+_CLOCK_TICK = timedelta(seconds=1)
+
+
+def _newest_first(commit: CommitInfo) -> float:
+    """Sort key ordering commits by timestamp, newest first."""
+    return -commit.timestamp_epoch
+
 
 class FakeRepository:
     """In-memory fake implementation of GitRepository protocol for testing."""
@@ -24,6 +43,13 @@ class FakeRepository:
         self._branches = branches or {}
         self._current_branch = current_branch
         self._is_dirty = is_dirty
+        self._head_commit = self._branches.get(current_branch)
+        # Memoized result of _get_base_branch, reset when branches change
+        self._base_branch: str | None = None
+        # Commits kept in newest-first order so graph queries are slices
+        self._commits_by_time = sorted(self._commits.values(), key=_newest_first)
+        # Source of unique ids for create_commit; no hashing needed in memory
+        self._commit_counter = len(self._commits)
 
     @property
     def path(self) -> Path:
@@ -43,7 +69,10 @@ class FakeRepository:
     @property
     def head_commit(self) -> CommitId | None:
         """Get the HEAD commit ID."""
-        return self._branches.get(self._current_branch)
+        return self._head_commit
+
+    def invalidate(self) -> None:
+        """Forget cached state; the in-memory repository has none."""
 
     def get_commit_graph(
         self,
@@ -59,12 +88,8 @@ class FakeRepository:
         current = current_branch or self._current_branch
         base = base_branch or self._get_base_branch()
 
-        # Get commits between base and current branch
-        commits_list = self._get_commits_between_branches(base, current)
-
-        # Apply limit if specified
-        if limit:
-            commits_list = commits_list[:limit]
+        # Get commits between base and current branch, up to the limit
+        commits_list = self._get_commits_between_branches(base, current, limit)
 
         return CommitGraph(
             commits=commits_list,
@@ -74,12 +99,18 @@ class FakeRepository:
     def get_commit_info(self, commit_id: CommitId) -> CommitInfo:
         """Get detailed information about a specific commit."""
         if commit_id not in self._commits:
-            raise InvalidCommitId(commit_id.full)
+            raise InvalidCommitId(commit_id)
 
         return self._commits[commit_id]
 
     def _get_base_branch(self) -> str:
         """Get the base branch (usually main or master)."""
+        if self._base_branch is None:
+            self._base_branch = self._find_base_branch()
+        return self._base_branch
+
+    def _find_base_branch(self) -> str:
+        """Pick the base branch from the existing branches."""
         # Check for common base branch names in order of preference
         candidate_branches = ["main", "master", "develop", "dev"]
 
@@ -96,15 +127,21 @@ class FakeRepository:
         # Fallback
         return "main"
 
+    def _set_branch(self, branch_name: str, commit_id: CommitId) -> None:
+        """Point a branch at a commit, creating the branch if needed."""
+        if branch_name not in self._branches:
+            self._base_branch = None
+        self._branches[branch_name] = commit_id
+        if branch_name == self._current_branch:
+            self._head_commit = commit_id
+
     def _get_commits_between_branches(
-        self, base_branch: str, current_branch: str
+        self, base_branch: str, current_branch: str, limit: int | None
     ) -> list[CommitInfo]:
         """Get commits between base branch and current branch."""
         # If branches are the same, return all commits
         if base_branch == current_branch:
-            commits_list = list(self._commits.values())
-            commits_list.sort(key=lambda c: c.timestamp, reverse=True)
-            return commits_list
+            return self._commits_by_time[: limit or None]
 
         # Get commit IDs for both branches
         base_commit_id = self._branches.get(base_branch)
@@ -112,39 +149,34 @@ class FakeRepository:
 
         if not current_commit_id:
             # Current branch doesn't exist, return all commits
-            commits_list = list(self._commits.values())
-            commits_list.sort(key=lambda c: c.timestamp, reverse=True)
-            return commits_list
+            return self._commits_by_time[: limit or None]
 
         if not base_commit_id:
             # Base branch doesn't exist, return commits from current branch
-            return self._get_commits_from_branch(current_branch)
+            return self._get_commits_from_branch(current_branch, limit)
 
         # Find commits that are in current branch but not in base branch
         # For simplicity in fake repo, we'll use timestamp-based logic
         base_commit = self._commits[base_commit_id]
 
-        # Get all commits newer than base commit
-        newer_commits = [
-            commit
-            for commit in self._commits.values()
-            if commit.timestamp > base_commit.timestamp
-        ]
-
-        # Sort by timestamp (newest first)
-        newer_commits.sort(key=lambda c: c.timestamp, reverse=True)
-        return newer_commits
+        # All commits newer than base commit form a prefix of the ordering
+        end = bisect_left(
+            self._commits_by_time, _newest_first(base_commit), key=_newest_first
+        )
+        if limit:
+            end = min(end, limit)
+        return self._commits_by_time[:end]
 
-    def _get_commits_from_branch(self, branch_name: str) -> list[CommitInfo]:
+    def _get_commits_from_branch(
+        self, branch_name: str, limit: int | None
+    ) -> list[CommitInfo]:
         """Get commits from a specific branch."""
         commit_id = self._branches.get(branch_name)
         if not commit_id:
             return []
 
         # For fake repo, just return all commits sorted by timestamp
-        commits_list = list(self._commits.values())
-        commits_list.sort(key=lambda c: c.timestamp, reverse=True)
-        return commits_list
+        return self._commits_by_time[: limit or None]
 
     @classmethod
     def create_test_repository(
@@ -153,7 +185,7 @@ class FakeRepository:
         current_branch: str = "main",
         is_dirty: bool = False,
         commit_count: int = 3,
-    ) -> "FakeRepository":
+    ) -> FakeRepository:
         """Create a fake repository with test commits."""
         repo_path = path or Path("/test/repo")
 
@@ -170,7 +202,7 @@ class FakeRepository:
                 email="test@example.com",
                 timestamp=datetime(2024, 1, i + 1, 12, 0, 0, tzinfo=UTC),
                 parent_ids=(commit_ids[-1],) if commit_ids else (),
-                files_changed=[f"file{i}.py", f"test{i}.py"],
+                files_changed=(f"file{i}.py", f"test{i}.py"),
             )
             commits[commit_id] = commit
             commit_ids.append(commit_id)
@@ -192,24 +224,28 @@ class FakeRepository:
 
     def add_commit(self, commit: CommitInfo) -> None:
         """Add a commit to the fake repository (for testing)."""
-        self._commits[commit.id] = commit
+        self._store_commit(commit)
 
         # Update current branch to point to new commit
-        self._branches[self._current_branch] = commit.id
+        self._set_branch(self._current_branch, commit.id)
 
     def add_branch(self, branch_name: str, commit_id: CommitId) -> None:
         """Add a branch pointing to a specific commit (for testing)."""
         if commit_id not in self._commits:
-            raise InvalidCommitId(commit_id.full)
+            raise InvalidCommitId(commit_id)
 
-        self._branches[branch_name] = commit_id
+        self._set_branch(branch_name, commit_id)
 
     def switch_branch(self, branch_name: str) -> None:
         """Switch to a different branch (for testing)."""
         if branch_name not in self._branches:
             raise ValueError(f"Branch {branch_name} does not exist")
 
+        if branch_name == self._current_branch:
+            return
+
         self._current_branch = branch_name
+        self._head_commit = self._branches[branch_name]
 
     def set_dirty(self, is_dirty: bool) -> None:
         """Set the dirty state of the repository (for testing)."""
@@ -217,30 +253,82 @@ class FakeRepository:
 
     def create_commit(self, request: CommitRequest) -> CommitId:
         """Create a new commit with the specified file operations."""
-        # Generate a new commit ID
-        import hashlib
-
-        content = (
-            f"{request.message}{request.author}{request.email}{len(self._commits)}"
+        return self._commit(
+            request.message,
+            request.author,
+            request.email,
+            request.parent_ids,
+            request.files_changed,
         )
-        commit_hash = hashlib.sha1(content.encode()).hexdigest()
-        commit_id = CommitId(commit_hash)
+
+    def create_commits_bulk(
+        self,
+        specs: Iterable[tuple[str, Mapping[PurePath, ContentOrRemoval]]],
+        *,
+        author: str,
+        email: str,
+    ) -> list[CommitId]:
+        """Create a chain of commits on the current branch (for testing).
+
+        Each (message, file_operations) spec becomes a commit whose parent
+        is the previously created one, starting from the current HEAD.
+        """
+        commit_ids = []
+        parent = self._head_commit
+        for message, file_operations in specs:
+            parent = self._commit(
+                message,
+                author,
+                email,
+                (parent,) if parent else (),
+                tuple(str(path) for path in file_operations),
+            )
+            commit_ids.append(parent)
+        return commit_ids
+
+    def _commit(
+        self,
+        message: str,
+        author: str,
+        email: str,
+        parent_ids: tuple[CommitId, ...],
+        files_changed: tuple[str, ...],
+    ) -> CommitId:
+        """Record a new commit on the current branch."""
+        # Generate a new commit ID; the counter leads so abbreviated ids differ
+        self._commit_counter += 1
+        commit_id = CommitId(f"{self._commit_counter:08x}".ljust(40, "0"))
+
+        # Timestamps come from a deterministic clock that always moves past
+        # the newest commit, keeping orderings reproducible
+        if self._commits_by_time:
+            timestamp = self._commits_by_time[0].timestamp + _CLOCK_TICK
+        else:
+            timestamp = _CLOCK_START
 
         # Create commit info
         commit_info = CommitInfo(
             id=commit_id,
-            message=request.message,
-            author=request.author,
-            email=request.email,
-            timestamp=datetime.now(UTC),
-            parent_ids=request.parent_ids,
-            files_changed=request.files_changed,
+            message=message,
+            author=author,
+            email=email,
+            timestamp=timestamp,
+            parent_ids=parent_ids,
+            files_changed=files_changed,
         )
 
         # Add commit to repository
-        self._commits[commit_id] = commit_info
+        self._store_commit(commit_info)
 
         # Update current branch to point to new commit
-        self._branches[self._current_branch] = commit_id
+        self._set_branch(self._current_branch, commit_id)
 
         return commit_id
+
+    def _store_commit(self, commit: CommitInfo) -> None:
+        """Record a commit, keeping the newest-first ordering in sync."""
+        previous = self._commits.get(commit.id)
+        if previous is not None:
+            self._commits_by_time.remove(previous)
+        self._commits[commit.id] = commit
+        insort(self._commits_by_time, commit, key=_newest_first)
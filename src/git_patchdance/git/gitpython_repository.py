@@ -1,10 +1,15 @@
 """GitPython-based implementation of GitRepository."""
 
+import re
+import time
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
+from functools import cached_property, partial
 from pathlib import Path
 
-from git import GitCommandError, InvalidGitRepositoryError, Repo
-from git.objects import Commit
+from git import GitCommandError, Head, InvalidGitRepositoryError, Repo
+from git.exc import BadName
+from git.objects import Blob, Commit
 
 from ..core.errors import (
     GitOperationError,
@@ -14,6 +19,49 @@ from ..core.errors import (
 )
 from ..core.models import CommitGraph, CommitId, CommitInfo, CommitRequest
 
+# Each record starts with \x01 and holds NUL-separated header fields
+# followed by the NUL-separated names of the files changed against the
+# first parent (or all files for a root commit)
+_LOG_FORMAT = "%x01%H%x00%P%x00%ct%x00%an%x00%ae%x00%B"
+_LOG_FIELDS = 6
+_LOG_CHUNK_SIZE = 64 * 1024
+
+# A record start is \x01 directly followed by a SHA-1 or SHA-256 and a NUL;
+# a bare \x01, e.g. inside a commit message, stays part of its record
+_LOG_RECORD_START = re.compile(rb"\x01[0-9a-f]{40}(?:[0-9a-f]{24})?\0")
+_LOG_RECORD_START_MAX = 66
+
+# Upper bound on converted commits kept per repository; commits are
+# immutable, so entries never go stale, only old
+_COMMIT_CACHE_SIZE = 10_000
+
+# Seconds an is_dirty answer is reused; the working tree can change
+# behind our back, but rescanning it on every read is expensive
+_DIRTY_TTL = 1.0
+
+
+def _split_log_records(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Split streamed git log output into records, minus their start marker.
+
+    Chunks are appended to one buffer and only newly arrived bytes are
+    scanned for record starts, so records spanning many chunks are not
+    re-split on every read.
+    """
+    buffer = bytearray()
+    scan_from = 1
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (match := _LOG_RECORD_START.search(buffer, scan_from)) is not None:
+            yield bytes(buffer[start + 1 : match.start()])
+            start = match.start()
+            scan_from = start + 1
+        # Drop the records already yielded; the rest is an incomplete record
+        del buffer[:start]
+        scan_from = max(scan_from - start, len(buffer) - _LOG_RECORD_START_MAX, 1)
+    if buffer:
+        yield bytes(buffer[1:])
+
 
 class GitPythonRepository:
     """GitPython-based implementation of GitRepository protocol."""
@@ -24,30 +72,47 @@ class GitPythonRepository:
             self._repo = Repo(path, search_parent_directories=True)
         except InvalidGitRepositoryError:
             raise RepositoryNotFound(path) from None
+        work_dir = self._repo.working_dir
+        if not work_dir:
+            raise RepositoryNotFound(path)
+        self._work_dir = Path(work_dir)
+        self._commit_cache: dict[str, CommitInfo] = {}
+        # (monotonic time checked, result) of the last working tree scan
+        self._dirty: tuple[float, bool] | None = None
 
     @property
     def path(self) -> Path:
         """Get the repository path."""
-        work_dir = self._repo.working_dir
-        if not work_dir:
-            raise RepositoryNotFound(Path.cwd())
-        return Path(work_dir)
+        return self._work_dir
 
-    @property
+    @cached_property
     def current_branch(self) -> str:
         """Get the current branch name."""
         return self._get_current_branch()
 
     @property
     def is_dirty(self) -> bool:
-        """Check if repository has uncommitted changes."""
-        return self._repo.is_dirty(untracked_files=True)
+        """Check if tracked files have uncommitted changes.
 
-    @property
+        Untracked files are not considered, as finding them means walking
+        the whole working tree.
+        """
+        now = time.monotonic()
+        if self._dirty is None or now - self._dirty[0] > _DIRTY_TTL:
+            self._dirty = (now, self._repo.is_dirty(untracked_files=False))
+        return self._dirty[1]
+
+    @cached_property
     def head_commit(self) -> CommitId | None:
         """Get the HEAD commit ID."""
         return self._get_head_commit()
 
+    def invalidate(self) -> None:
+        """Forget cached branch, HEAD and dirty state so they are re-read."""
+        for name in ("current_branch", "head_commit"):
+            self.__dict__.pop(name, None)
+        self._dirty = None
+
     def get_commit_graph(
         self,
         limit: int | None = None,
@@ -76,11 +141,22 @@ class GitPythonRepository:
 
     def get_commit_info(self, commit_id: CommitId) -> CommitInfo:
         """Get detailed information about a specific commit."""
+        cached = self._commit_cache.get(commit_id)
+        if cached is not None:
+            return cached
         try:
-            commit = self._repo.commit(commit_id.full)
-            return self._convert_commit(commit)
+            commit = self._repo.commit(commit_id)
+            return self._cache_commit(self._convert_commit(commit))
         except Exception as e:
-            raise InvalidCommitId(commit_id.full) from e
+            raise InvalidCommitId(commit_id) from e
+
+    def _cache_commit(self, commit_info: CommitInfo) -> CommitInfo:
+        """Remember a converted commit, evicting the oldest entry when full."""
+        cache = self._commit_cache
+        cache[commit_info.id] = commit_info
+        if len(cache) > _COMMIT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        return commit_info
 
     def _get_current_branch(self) -> str:
         """Get the current branch name."""
@@ -102,18 +178,16 @@ class GitPythonRepository:
         # Check for common base branch names in order of preference
         candidate_branches = ["main", "master", "develop", "dev"]
 
-        # Get all branch names
         try:
-            branch_names = [ref.name for ref in self._repo.heads]
-
-            # Find first candidate that exists
+            # Probe each candidate ref directly rather than listing all heads
             for candidate in candidate_branches:
-                if candidate in branch_names:
+                if Head(self._repo, f"refs/heads/{candidate}").is_valid():
                     return candidate
 
             # If no common base branch found, return first available branch
-            if branch_names:
-                return branch_names[0]
+            heads = self._repo.heads
+            if heads:
+                return str(heads[0].name)
 
             # Fallback to HEAD if no branches exist
             return "HEAD"
@@ -124,20 +198,22 @@ class GitPythonRepository:
         self, base_branch: str, current_branch: str, limit: int
     ) -> list[CommitInfo]:
         """Get commits between base branch and current branch."""
-        commits: list[CommitInfo] = []
-
         try:
             # If current branch is the same as base branch, show recent commits
             if base_branch == current_branch:
                 return self._get_commits(limit)
 
+            # A range with a missing end would only fail inside git log
+            if not (
+                self._has_revision(base_branch) and self._has_revision(current_branch)
+            ):
+                return self._get_commits(limit)
+
             # Use git log syntax: base_branch..current_branch to get commits
             # that are in current_branch but not in base_branch
             commit_range = f"{base_branch}..{current_branch}"
 
-            for commit in self._repo.iter_commits(commit_range, max_count=limit):
-                commit_info = self._convert_commit(commit)
-                commits.append(commit_info)
+            return self._log_commits(commit_range, limit=limit)
 
         except Exception as e:
             # Fallback to regular commit listing if range fails
@@ -146,39 +222,90 @@ class GitPythonRepository:
             except Exception:
                 raise GitOperationError("get_commits_between_branches") from e
 
-        return commits
+    def _has_revision(self, name: str) -> bool:
+        """Check whether a revision resolves, without spawning git."""
+        try:
+            self._repo.rev_parse(name)
+        except (BadName, ValueError):
+            return False
+        return True
 
     def _get_commits(self, limit: int) -> list[CommitInfo]:
         """Get list of commits from repository."""
-        commits = []
-
         try:
             # Get commits from HEAD
-            for commit in self._repo.iter_commits(max_count=limit):
-                commit_info = self._convert_commit(commit)
-                commits.append(commit_info)
+            return self._log_commits("HEAD", limit=limit)
         except Exception as e:
             raise GitOperationError("get_commits") from e
 
-        return commits
+    def _log_commits(self, revision: str, *, limit: int) -> list[CommitInfo]:
+        """List commits and their changed files with a single git log call."""
+        return list(self._iter_log_commits(revision, limit=limit))
+
+    def _iter_log_commits(self, revision: str, *, limit: int) -> Iterator[CommitInfo]:
+        """Stream commits from git log, parsing records as they arrive."""
+        process = self._repo.git.log(
+            "-z",
+            "--no-renames",
+            "--name-only",
+            "--root",
+            "--diff-merges=first-parent",
+            f"--format={_LOG_FORMAT}",
+            f"--max-count={limit}",
+            revision,
+            "--",
+            as_process=True,
+        )
+
+        chunks = iter(partial(process.stdout.read, _LOG_CHUNK_SIZE), b"")
+        for record in _split_log_records(chunks):
+            yield self._parse_log_record(record)
+        # Raises GitCommandError if git log failed, e.g. for an unknown ref
+        process.wait()
+
+    def _parse_log_record(self, record: bytes) -> CommitInfo:
+        """Convert one git log record into a (cached) CommitInfo."""
+        fields = record.decode("utf-8", errors="replace").split("\0")
+        sha, parents, committed, author, email, message = fields[:_LOG_FIELDS]
+        cached = self._commit_cache.get(sha)
+        if cached is not None:
+            return cached
+        files_changed = fields[_LOG_FIELDS:]
+        if files_changed:
+            # The file list is separated from the header by a newline
+            files_changed[0] = files_changed[0].removeprefix("\n")
+        return self._cache_commit(
+            CommitInfo.interned(
+                id=sha,
+                message=message,
+                author=author,
+                email=email,
+                timestamp=datetime.fromtimestamp(int(committed), tz=UTC),
+                parent_ids=parents.split(),
+                files_changed=(path for path in files_changed if path),
+            )
+        )
 
     def _convert_commit(self, commit: Commit) -> CommitInfo:
         """Convert GitPython commit to CommitInfo."""
-        # Get parent commit IDs
-        parent_ids = [CommitId(parent.hexsha) for parent in commit.parents]
-
         # Get list of changed files
         files_changed = []
         try:
             if commit.parents:
-                # Compare with first parent to get changed files
-                diffs = commit.parents[0].diff(commit)
-                files_changed = [
-                    val for diff in diffs if (val := diff.a_path or diff.b_path)
+                # Compare with first parent to get changed files; rename
+                # detection is skipped as only the touched paths matter
+                paths = [
+                    diff.a_path or diff.b_path
+                    for diff in commit.parents[0].diff(commit, no_renames=True)
                 ]
+                files_changed = [path for path in paths if path]
             else:
-                # Initial commit - get all files
-                files_changed = [str(x) for x in commit.stats.files]
+                # Initial commit - every file in the tree is new
+                files_changed = [
+                    str(entry.path)
+                    for entry in commit.tree.traverse()
+                    if isinstance(entry, Blob)
+                ]
         except Exception:
             # Fallback if diff fails
             files_changed = []
@@ -187,18 +314,21 @@ class GitPythonRepository:
         timestamp = datetime.fromtimestamp(commit.committed_date, tz=UTC)
 
         # Handle message encoding
-        if isinstance(commit.message, bytes):
-            message = commit.message.decode("utf-8", errors="replace")
+        raw_message = commit.message
+        if isinstance(raw_message, bytes):
+            message = raw_message.decode("utf-8", errors="replace")
         else:
-            message = str(commit.message)
+            message = raw_message
+
+        actor = commit.author
 
-        return CommitInfo(
-            id=CommitId(commit.hexsha),
+        return CommitInfo.interned(
+            id=commit.hexsha,
             message=message,
-            author=commit.author.name or "",
-            email=commit.author.email or "",
+            author=actor.name or "",
+            email=actor.email or "",
             timestamp=timestamp,
-            parent_ids=tuple(parent_ids) if parent_ids else (),
+            parent_ids=(parent.hexsha for parent in commit.parents),
             files_changed=files_changed,
         )
 
@@ -206,23 +336,36 @@ class GitPythonRepository:
         """Create a new commit with the specified file operations."""
         try:
             # Apply file operations to working directory
+            work_dir = self._work_dir
+            to_add: list[str] = []
+            to_remove: list[str] = []
             for file_path, content in request.file_operations.items():
-                full_path = self.path / file_path
+                full_path = work_dir / file_path
 
                 if content is None:
-                    # File removal
-                    if full_path.exists():
+                    # File removal; a single unlink doubles as the existence check
+                    try:
                         full_path.unlink()
-                        # Remove from git index
-                        self._repo.index.remove([str(file_path)])
+                    except FileNotFoundError:
+                        pass
+                    else:
+                        to_remove.append(str(file_path))
                 else:
                     # File creation/modification
                     # Ensure parent directories exist
                     full_path.parent.mkdir(parents=True, exist_ok=True)
                     # Write file content
-                    full_path.write_text(content, encoding="utf-8")
-                    # Add to git index
-                    self._repo.index.add([str(file_path)])
+                    if isinstance(content, bytes):
+                        full_path.write_bytes(content)
+                    else:
+                        full_path.write_text(content, encoding="utf-8")
+                    to_add.append(str(file_path))
+
+            # Update the git index once for all files
+            if to_remove:
+                self._repo.index.remove(to_remove)
+            if to_add:
+                self._repo.index.add(to_add)
 
             # Create the commit with specified author
             from git import Actor
@@ -233,9 +376,7 @@ class GitPythonRepository:
                 request.message,
                 author=author,
                 committer=author,
-                parent_commits=[
-                    self._repo.commit(pid.full) for pid in request.parent_ids
-                ]
+                parent_commits=[self._repo.commit(pid) for pid in request.parent_ids]
                 if request.parent_ids
                 else None,
             )
@@ -244,3 +385,5 @@ class GitPythonRepository:
 
         except Exception as e:
             raise GitOperationError("create_commit") from e
+        finally:
+            self.invalidate()
@@ -31,7 +31,7 @@ class GitRepository(Protocol):
 
     @property
     def is_dirty(self) -> bool:
-        """Check if repository has uncommitted changes."""
+        """Check if tracked files have uncommitted changes."""
         ...
 
     @property
@@ -39,6 +39,10 @@ class GitRepository(Protocol):
         """Get the HEAD commit ID."""
         ...
 
+    def invalidate(self) -> None:
+        """Drop cached repository state so the next read reflects the disk."""
+        ...
+
     def get_commit_graph(
         self,
         limit: int | None = None,
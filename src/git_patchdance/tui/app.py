@@ -1,6 +1,7 @@
 """Textual-based TUI application for Git Patchdance."""
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from textual.app import App, ComposeResult
@@ -11,7 +12,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Footer, Header, Label, ListItem, ListView, Log, Static
 
 from ..core.errors import GitPatchError
-from ..core.models import CommitGraph, CommitInfo
+from ..core.models import CommitGraph, CommitId, CommitInfo
 from ..git.repository import GitRepository
 
 
@@ -54,19 +55,24 @@ Press [bold]Esc[/bold], [bold]q[/bold], or [bold]?[/bold] to close this help."""
 class CommitList(ListView):
     """Widget to display list of commits."""
 
-    commits: reactive[list[CommitInfo]] = reactive([])
     BORDER_TITLE = "Commits"
 
-    def watch_commits(self, commits: list[CommitInfo]) -> None:
-        """Update display when commits change."""
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(ListItem(Label("No commits found")), **kwargs)
+        self.commits: list[CommitInfo] = []
+
+    def show_graph(self, graph: CommitGraph) -> None:
+        """Display the commits of a graph, one row per commit."""
+        self.commits = graph.commits
         self.clear()
-        if not commits:
+        if not graph.commits:
             self.append(ListItem(Label("No commits found")))
             return
 
-        for commit in commits:
-            item_text = f"{commit.id} {commit.summary()[:60]}"
-            self.append(ListItem(Label(item_text)))
+        self.extend(
+            ListItem(Label(f"{short_id} {summary[:60]}"))
+            for short_id, summary in zip(graph.short_ids, graph.summaries, strict=True)
+        )
 
 
 class CommitDetails(Static):
@@ -76,20 +82,31 @@ class CommitDetails(Static):
 
     def __init__(self) -> None:
         super().__init__("Select a commit to view details")
+        # Commits are immutable, so each one is formatted at most once per
+        # loaded graph
+        self._details: dict[CommitId, str] = {}
+
+    def clear_cache(self) -> None:
+        """Forget formatted details, e.g. when a new graph is loaded."""
+        self._details.clear()
 
     def show_commit(self, commit: CommitInfo) -> None:
         """Show details for a commit."""
-        details = [
-            f"Commit: {commit.id.full}",
-            f"Author: {commit.author} <{commit.email}>",
-            f"Date: {commit.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-            f"Parents: {len(commit.parent_ids)}",
-            f"Files: {len(commit.files_changed)}",
-            "",
-            "Message:",
-            commit.message,
-        ]
-        self.update("\n".join(details))
+        text = self._details.get(commit.id)
+        if text is None:
+            text = self._details[commit.id] = "\n".join(
+                [
+                    f"Commit: {commit.id}",
+                    f"Author: {commit.author} <{commit.email}>",
+                    f"Date: {commit.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+                    f"Parents: {len(commit.parent_ids)}",
+                    f"Files: {len(commit.files_changed)}",
+                    "",
+                    "Message:",
+                    commit.message,
+                ]
+            )
+        self.update(text)
 
 
 class TuiApp(App[None]):
@@ -146,6 +163,9 @@ class TuiApp(App[None]):
         super().__init__(**kwargs)
         self.git_repository = git_repository
         self.commit_graph: CommitGraph | None = None
+        # Repository objects are not thread-safe, so all git work runs on
+        # one long-lived worker thread
+        self._git_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="git")
 
     def compose(self) -> ComposeResult:
         """Create the layout."""
@@ -200,23 +220,28 @@ class TuiApp(App[None]):
             self.write_log(f"Full traceback:\n{tb}")
             self.status_bar.update(f"Error: {e}")
 
+    def on_unmount(self) -> None:
+        """Release the git worker thread."""
+        self._git_executor.shutdown(wait=False, cancel_futures=True)
+
     async def load_repository_data(self) -> None:
         """Load repository data."""
         try:
             self.status_bar.update("Loading commits...")
 
-            self.commit_graph = await asyncio.to_thread(
-                self.git_repository.get_commit_graph, 50
+            self.commit_graph = await asyncio.get_running_loop().run_in_executor(
+                self._git_executor, self.git_repository.get_commit_graph, 50
             )
 
-            self.commit_list.commits = self.commit_graph.commits
+            self.commit_list.show_graph(self.commit_graph)
+            self.commit_details.clear_cache()
             self.selected_index = 0
 
             if self.commit_graph.commits:
                 self.commit_details.show_commit(self.commit_graph.commits[0])
                 self.status_bar.update(
                     f"Loaded {len(self.commit_graph.commits)} commits "
-                    f"from {self.git_repository.current_branch}"
+                    f"from {self.commit_graph.current_branch}"
                 )
             else:
                 self.commit_details.update("No commits found in repository")
@@ -271,6 +296,7 @@ class TuiApp(App[None]):
     async def action_refresh(self) -> None:
         """Refresh repository data."""
         try:
+            self.git_repository.invalidate()
             await self.load_repository_data()
             self.write_log("Repository refreshed")
         except GitPatchError as e:
@@ -1,8 +1,7 @@
 """Shared test fixtures for Git Patchdance tests."""
 
-from collections.abc import Generator
+import shutil
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from typing import Any
 
 import pytest
@@ -11,28 +10,44 @@ from git import Repo
 from git_patchdance.core.models import CommitId
 
 
+@pytest.fixture(scope="session")
+def seeded_git_repo(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Any]:
+    """Create a git repository with one commit, shared read-only by the session."""
+    repo_path = tmp_path_factory.mktemp("seeded_repo")
+    repo = Repo.init(repo_path)
+
+    # Configure git user for test commits
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "Test User")
+        config.set_value("user", "email", "test@example.com")
+
+    # Create initial commit
+    test_file = repo_path / "test.txt"
+    test_file.write_text("Initial content\n")
+    repo.index.add([str(test_file)])
+    initial_commit = repo.index.commit("Initial commit")
+
+    return {
+        "path": repo_path,
+        "initial_commit": CommitId(initial_commit.hexsha),
+    }
+
+
 @pytest.fixture
-def temp_git_repo() -> Generator[dict[str, Any], None, None]:
-    """Create a temporary git repository for testing."""
-    with TemporaryDirectory() as temp_dir:
-        repo_path = Path(temp_dir)
-        repo = Repo.init(repo_path)
-
-        # Configure git user for test commits
-        repo.config_writer().set_value("user", "name", "Test User").release()
-        repo.config_writer().set_value("user", "email", "test@example.com").release()
-
-        # Create initial commit
-        test_file = repo_path / "test.txt"
-        test_file.write_text("Initial content\n")
-        repo.index.add([str(test_file)])
-        initial_commit = repo.index.commit("Initial commit")
-
-        yield {
-            "path": repo_path,
-            "repo": repo,
-            "initial_commit": CommitId(initial_commit.hexsha),
-        }
+def temp_git_repo(seeded_git_repo: dict[str, Any], tmp_path: Path) -> dict[str, Any]:
+    """Create a temporary git repository for testing.
+
+    The repository is a private copy of the session's seeded repository,
+    so tests may modify it freely.
+    """
+    repo_path = tmp_path / "repo"
+    shutil.copytree(seeded_git_repo["path"], repo_path)
+
+    return {
+        "path": repo_path,
+        "repo": Repo(repo_path),
+        "initial_commit": seeded_git_repo["initial_commit"],
+    }
 
 
 @pytest.fixture
@@ -1,9 +1,8 @@
 """Unit tests for commit creation functionality."""
 
-from pathlib import Path, PurePath
+from pathlib import PurePath
 
 import pytest
-from git import Repo
 
 from git_patchdance.core.models import CommitId, CommitRequest
 from git_patchdance.git.fake_repository import FakeRepository
@@ -13,33 +12,18 @@ from git_patchdance.git.gitpython_repository import GitPythonRepository
 @pytest.fixture(
     params=[
         pytest.param("fake", id="fake_repository"),
-        pytest.param("real", id="gitpython_repository"),
+        pytest.param("real", id="gitpython_repository", marks=pytest.mark.slow),
     ]
 )
-def repository(
-    request: pytest.FixtureRequest, tmp_path: Path
-) -> FakeRepository | GitPythonRepository:
+def repository(request: pytest.FixtureRequest) -> FakeRepository | GitPythonRepository:
     """Fixture providing both fake and real repository implementations."""
     if request.param == "fake":
         # Create fake repository with initial commit
         return FakeRepository.create_test_repository(commit_count=1)
     else:
-        # Create real git repository in temporary directory
-        git_repo = Repo.init(tmp_path)
-
-        # Configure git user for test commits
-        git_repo.config_writer().set_value("user", "name", "Test User").release()
-        git_repo.config_writer().set_value(
-            "user", "email", "test@example.com"
-        ).release()
-
-        # Create initial commit
-        test_file = tmp_path / "initial.txt"
-        test_file.write_text("Initial content\n")
-        git_repo.index.add([str(test_file)])
-        git_repo.index.commit("Initial commit")
-
-        return GitPythonRepository(tmp_path)
+        # Copy of the session's seeded git repository with an initial commit
+        temp_git_repo = request.getfixturevalue("temp_git_repo")
+        return GitPythonRepository(temp_git_repo["path"])
 
 
 @pytest.fixture
@@ -77,7 +61,7 @@ class TestCreateCommit:
 
         commit_id = repository.create_commit(request)
 
-        assert isinstance(commit_id, CommitId)
+        assert isinstance(commit_id, str)
 
         # Verify commit was added
         commit_info = repository.get_commit_info(commit_id)
@@ -217,6 +201,47 @@ class TestCreateCommit:
         # HEAD should point to latest commit
         assert repository.head_commit == commit2_id
 
+    def test_create_commit_with_bytes_content(
+        self, repository: FakeRepository | GitPythonRepository
+    ) -> None:
+        """Test that pre-encoded bytes content is accepted."""
+        request = CommitRequest(
+            message="Add binary file",
+            author="Dev",
+            email="dev@example.com",
+            file_operations={PurePath("data.bin"): b"\x00\xffpayload"},
+        )
+        commit_id = repository.create_commit(request)
+
+        assert repository.get_commit_info(commit_id).files_changed == ("data.bin",)
+        if isinstance(repository, GitPythonRepository):
+            assert (repository.path / "data.bin").read_bytes() == b"\x00\xffpayload"
+
+    def test_commit_graph_lists_created_commits(
+        self, repository: FakeRepository | GitPythonRepository
+    ) -> None:
+        """Test the commit graph reports the same data as get_commit_info."""
+        request = CommitRequest(
+            message="Add package\n\nWith a body",
+            author="Dev",
+            email="dev@example.com",
+            file_operations={
+                PurePath("pkg/__init__.py"): "",
+                PurePath("pkg/core.py"): "# Core",
+            },
+            parent_ids=(repository.head_commit,) if repository.head_commit else (),
+        )
+        commit_id = repository.create_commit(request)
+
+        graph = repository.get_commit_graph()
+
+        assert graph.commits[0] == repository.get_commit_info(commit_id)
+        assert set(graph.commits[0].files_changed) == {
+            "pkg/__init__.py",
+            "pkg/core.py",
+        }
+        assert graph.commits[0].parent_ids == (graph.commits[1].id,)
+
 
 class TestCommitRequestModel:
     """Test the CommitRequest data model."""
@@ -20,6 +20,11 @@ class TestDemoRepository:
         commit_graph = repo.get_commit_graph()
         assert len(commit_graph.commits) == 7
 
+    def test_demo_repository_short_ids_are_distinct(self) -> None:
+        """Test that every demo commit has a distinct abbreviated id."""
+        commit_graph = create_demo_repository().get_commit_graph()
+        assert len(set(commit_graph.short_ids)) == len(commit_graph.commits)
+
     def test_demo_repository_initial_commit(self) -> None:
         """Test the initial commit of the demo repository."""
         repo = create_demo_repository()
@@ -61,7 +66,7 @@ class TestDemoRepository:
         assert len(module_commits) == 6
 
         # Check that each expected module file is in the commits
-        all_files = set()
+        all_files: set[str] = set()
         for commit in module_commits:
             all_files.update(commit.files_changed)
 
@@ -140,7 +145,7 @@ class TestDemoRepository:
         commit_graph = repo.get_commit_graph()
 
         # Collect all files from all commits
-        all_files = set()
+        all_files: set[str] = set()
         for commit in commit_graph.commits:
             all_files.update(commit.files_changed)
 
@@ -0,0 +1,56 @@
+"""Unit tests for the exception hierarchy."""
+
+import pickle
+from pathlib import Path
+
+import pytest
+
+from git_patchdance.core.errors import (
+    GitOperationError,
+    GitPatchError,
+    InvalidCommitId,
+    NoCommitsFound,
+    RepositoryNotFound,
+)
+
+
+class TestErrors:
+    """Tests for exception messages and attributes."""
+
+    @pytest.mark.parametrize(
+        ("error", "message"),
+        [
+            pytest.param(
+                RepositoryNotFound(Path("/no/repo")),
+                "Git repository not found at: /no/repo",
+                id="repository_not_found",
+            ),
+            pytest.param(
+                InvalidCommitId("abc123"),
+                "Invalid commit ID: abc123",
+                id="invalid_commit_id",
+            ),
+            pytest.param(NoCommitsFound(), "No commits found", id="no_commits"),
+            pytest.param(
+                GitOperationError("create_commit"),
+                "Git operation failed: create_commit",
+                id="git_operation",
+            ),
+        ],
+    )
+    def test_error_message(self, error: GitPatchError, message: str) -> None:
+        """Test messages are formatted from the stored values."""
+        assert str(error) == message
+
+    def test_error_keeps_raw_values(self) -> None:
+        """Test the raw values stay available to handlers."""
+        error = InvalidCommitId("abc123")
+
+        assert error.commit_id == "abc123"
+        assert isinstance(error, GitPatchError)
+
+    def test_error_pickle_roundtrip(self) -> None:
+        """Test errors survive pickling, e.g. across process pools."""
+        error = pickle.loads(pickle.dumps(RepositoryNotFound(Path("/no/repo"))))
+
+        assert error.path == Path("/no/repo")
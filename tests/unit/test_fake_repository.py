@@ -0,0 +1,168 @@
+"""Unit tests for the in-memory FakeRepository."""
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path, PurePath
+
+from git_patchdance.core.models import CommitId, CommitInfo, CommitRequest, short
+from git_patchdance.git.fake_repository import FakeRepository
+
+
+def make_commit(name: str, day: int) -> CommitInfo:
+    """Create a commit with a timestamp on the given day of January 2024."""
+    return CommitInfo(
+        id=CommitId(name.ljust(40, "0")),
+        message=f"Commit {name}",
+        author="Test Author",
+        email="test@example.com",
+        timestamp=datetime(2024, 1, day, tzinfo=UTC),
+        parent_ids=(),
+        files_changed=(),
+    )
+
+
+class TestCommitOrdering:
+    """Test that graph queries return commits newest first."""
+
+    def test_added_commits_are_ordered_by_timestamp(self) -> None:
+        """Test out-of-order additions still come back newest first."""
+        repo = FakeRepository.create_test_repository(commit_count=2)
+        repo.add_commit(make_commit("late", 20))
+        repo.add_commit(make_commit("early", 10))
+
+        days = [c.timestamp.day for c in repo.get_commit_graph().commits]
+        assert days == [20, 10, 2, 1]
+
+    def test_replacing_a_commit_keeps_one_entry(self) -> None:
+        """Test re-adding a commit id replaces its position in the ordering."""
+        repo = FakeRepository.create_test_repository(commit_count=2)
+        commit = make_commit("moved", 5)
+        repo.add_commit(commit)
+        repo.add_commit(replace(commit, timestamp=datetime(2023, 1, 1, tzinfo=UTC)))
+
+        ids = [c.id for c in repo.get_commit_graph().commits]
+        assert ids.count(commit.id) == 1
+        assert ids[-1] == commit.id
+
+    def test_commits_newer_than_base_branch(self) -> None:
+        """Test only commits newer than the base branch head are returned."""
+        repo = FakeRepository.create_test_repository(commit_count=2)
+        head = repo.head_commit
+        assert head is not None
+        repo.add_branch("feature", head)
+        repo.switch_branch("feature")
+        repo.add_commit(make_commit("feature", 15))
+
+        graph = repo.get_commit_graph(base_branch="main")
+        assert [c.message for c in graph.commits] == ["Commit feature"]
+
+    def test_limit_applies_to_every_query(self) -> None:
+        """Test the limit is honoured with and without a base branch."""
+        repo = FakeRepository.create_test_repository(commit_count=3)
+        head = repo.head_commit
+        assert head is not None
+        repo.add_branch("feature", head)
+        repo.switch_branch("feature")
+        repo.add_commit(make_commit("newer", 15))
+        repo.add_commit(make_commit("newest", 20))
+
+        all_commits = repo.get_commit_graph(limit=2, base_branch="feature")
+        assert [c.timestamp.day for c in all_commits.commits] == [20, 15]
+        since_base = repo.get_commit_graph(limit=1, base_branch="main")
+        assert [c.timestamp.day for c in since_base.commits] == [20]
+        missing_base = repo.get_commit_graph(limit=3, base_branch="missing")
+        assert len(missing_base.commits) == 3
+
+
+class TestCreateCommit:
+    """Test commit creation in the fake repository."""
+
+    def test_created_commit_ids_are_unique_hex(self) -> None:
+        """Test created commits get distinct 40-character hex ids."""
+        repo = FakeRepository.create_test_repository(commit_count=0)
+        ids = [
+            repo.create_commit(
+                CommitRequest(
+                    message="Same",
+                    author="A",
+                    email="a@example.com",
+                    file_operations={},
+                )
+            )
+            for _ in range(3)
+        ]
+
+        assert len(set(ids)) == 3
+        assert all(len(i) == 40 and int(i, 16) for i in ids)
+        assert len({short(i) for i in ids}) == 3
+
+    def test_created_commits_use_a_deterministic_clock(self) -> None:
+        """Test created commits are timestamped one second after the newest."""
+        repo = FakeRepository.create_test_repository(commit_count=2)
+        newest = repo.get_commit_graph().commits[0].timestamp
+
+        ids = repo.create_commits_bulk(
+            [("First", {}), ("Second", {})], author="A", email="a@example.com"
+        )
+
+        assert [repo.get_commit_info(i).timestamp for i in ids] == [
+            newest + timedelta(seconds=1),
+            newest + timedelta(seconds=2),
+        ]
+
+    def test_create_commits_bulk_chains_parents(self) -> None:
+        """Test bulk-created commits form a chain starting at HEAD."""
+        repo = FakeRepository.create_test_repository(commit_count=1)
+        start = repo.head_commit
+
+        ids = repo.create_commits_bulk(
+            [
+                ("First", {PurePath("a.py"): "a"}),
+                ("Second", {PurePath("b.py"): b"b"}),
+            ],
+            author="A",
+            email="a@example.com",
+        )
+
+        assert repo.head_commit == ids[-1]
+        assert repo.get_commit_info(ids[0]).parent_ids == (start,)
+        assert repo.get_commit_info(ids[1]).parent_ids == (ids[0],)
+        assert repo.get_commit_info(ids[1]).files_changed == ("b.py",)
+
+
+class TestHeadCommit:
+    """Test HEAD tracking in the fake repository."""
+
+    def test_head_follows_branch_switches_and_commits(self) -> None:
+        """Test head_commit tracks the current branch as it changes."""
+        repo = FakeRepository.create_test_repository(commit_count=2)
+        main_head = repo.head_commit
+        repo.add_branch("feature", CommitId(f"commit000{'0' * 37}"))
+
+        repo.switch_branch("feature")
+        assert repo.head_commit == CommitId(f"commit000{'0' * 37}")
+
+        commit = make_commit("feature", 15)
+        repo.add_commit(commit)
+        assert repo.head_commit == commit.id
+
+        repo.switch_branch("main")
+        assert repo.head_commit == main_head
+
+
+class TestBaseBranch:
+    """Test base branch selection in the fake repository."""
+
+    def test_base_branch_updates_when_branches_are_added(self) -> None:
+        """Test a newly added preferred branch becomes the base branch."""
+        commit = make_commit("root", 1)
+        repo = FakeRepository(
+            path=Path("/test/repo"),
+            commits={commit.id: commit},
+            branches={"feature": commit.id},
+            current_branch="feature",
+        )
+        assert repo._get_base_branch() == "feature"
+
+        repo.add_branch("master", commit.id)
+        assert repo._get_base_branch() == "master"
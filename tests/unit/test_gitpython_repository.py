@@ -0,0 +1,170 @@
+"""Unit tests for the GitPython repository implementation."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from git import Repo
+
+from git_patchdance.core.models import CommitId
+from git_patchdance.git.gitpython_repository import (
+    _DIRTY_TTL,
+    GitPythonRepository,
+    _split_log_records,
+)
+
+
+class TestGitPythonRepositoryState:
+    """Test cached repository state of the GitPython implementation."""
+
+    @pytest.mark.slow
+    def test_invalidate_picks_up_external_commits(self, tmp_path: Path) -> None:
+        """Test HEAD is cached until invalidate() is called."""
+        git_repo = Repo.init(tmp_path)
+        git_repo.index.commit("First")
+        repository = GitPythonRepository(tmp_path)
+        first = repository.head_commit
+
+        second = git_repo.index.commit("Second")
+        assert repository.head_commit == first
+
+        repository.invalidate()
+        assert repository.head_commit == second.hexsha
+
+    @pytest.mark.slow
+    def test_commit_info_is_cached_by_sha(self, tmp_path: Path) -> None:
+        """Test listed commits are reused by get_commit_info."""
+        git_repo = Repo.init(tmp_path)
+        sha = git_repo.index.commit("Only").hexsha
+        repository = GitPythonRepository(tmp_path)
+
+        listed = repository.get_commit_graph().commits[0]
+
+        assert repository.get_commit_info(CommitId(sha)) is listed
+        assert repository.get_commit_graph().commits[0] is listed
+
+    @pytest.mark.slow
+    def test_is_dirty_is_cached_for_ttl(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the dirty state is reused within the TTL and rescanned after."""
+        clock = [1000.0]
+        monkeypatch.setattr(
+            "git_patchdance.git.gitpython_repository.time.monotonic",
+            lambda: clock[0],
+        )
+        git_repo = Repo.init(tmp_path)
+        tracked = tmp_path / "tracked.txt"
+        tracked.write_text("original\n")
+        git_repo.index.add([str(tracked)])
+        git_repo.index.commit("First")
+        repository = GitPythonRepository(tmp_path)
+        observed = [repository.is_dirty]
+
+        # Within the TTL the cached answer is reused
+        tracked.write_text("modified\n")
+        clock[0] += _DIRTY_TTL / 2
+        observed.append(repository.is_dirty)
+
+        # Once the TTL has passed the working tree is scanned again
+        clock[0] += _DIRTY_TTL
+        observed.append(repository.is_dirty)
+
+        # invalidate() forces a new scan even within the TTL
+        tracked.write_text("original\n")
+        observed.append(repository.is_dirty)
+        repository.invalidate()
+        observed.append(repository.is_dirty)
+
+        assert observed == [False, False, True, True, False]
+
+    @pytest.mark.slow
+    def test_missing_base_branch_lists_head_commits(self, tmp_path: Path) -> None:
+        """Test an unknown base branch falls back to listing from HEAD."""
+        git_repo = Repo.init(tmp_path)
+        git_repo.index.commit("First")
+        git_repo.index.commit("Second")
+        repository = GitPythonRepository(tmp_path)
+
+        graph = repository.get_commit_graph(base_branch="does-not-exist")
+
+        assert [c.summary() for c in graph.commits] == ["Second", "First"]
+
+    @pytest.mark.slow
+    def test_untracked_files_do_not_make_repository_dirty(self, tmp_path: Path) -> None:
+        """Test only tracked changes count towards is_dirty."""
+        git_repo = Repo.init(tmp_path)
+        git_repo.index.commit("First")
+        (tmp_path / "untracked.txt").write_text("new\n")
+
+        assert not GitPythonRepository(tmp_path).is_dirty
+
+    @pytest.mark.slow
+    def test_commit_message_may_contain_record_marker(self, tmp_path: Path) -> None:
+        """Test a \\x01 inside a commit message does not split its record."""
+        git_repo = Repo.init(tmp_path)
+        git_repo.index.commit("First")
+        git_repo.index.commit("Second\x01with marker")
+
+        graph = GitPythonRepository(tmp_path).get_commit_graph()
+
+        assert [c.message for c in graph.commits] == ["Second\x01with marker", "First"]
+
+    @pytest.mark.slow
+    def test_log_parser_matches_commit_conversion(
+        self, temp_git_repo: dict[str, Any]
+    ) -> None:
+        """Test git log records parse to the same data as GitPython commits."""
+        repo_path = temp_git_repo["path"]
+        git_repo = temp_git_repo["repo"]
+        (repo_path / "pkg").mkdir()
+        (repo_path / "pkg" / "core.py").write_text("# Core\n")
+        git_repo.index.add(["pkg/core.py"])
+        git_repo.index.commit("Add core")
+        git_repo.git.mv("pkg/core.py", "pkg/renamed.py")
+        git_repo.git.commit("-m", "Rename core")
+        git_repo.git.checkout("-b", "side", "HEAD~1")
+        (repo_path / "side.txt").write_text("side\n")
+        git_repo.git.add("side.txt")
+        git_repo.git.commit("-m", "Side change")
+        git_repo.git.checkout("-")
+        git_repo.git.merge("--no-ff", "-m", "Merge side", "side")
+
+        # A fresh repository object has an empty cache, so every listed
+        # commit goes through the git log parser
+        listed = GitPythonRepository(repo_path).get_commit_graph().commits
+        converter = GitPythonRepository(repo_path)
+
+        assert {c.summary() for c in listed} == {
+            "Initial commit",
+            "Add core",
+            "Rename core",
+            "Side change",
+            "Merge side",
+        }
+        by_summary = {c.summary(): c for c in listed}
+        assert by_summary["Merge side"].is_merge()
+        assert by_summary["Merge side"].files_changed == ("side.txt",)
+        assert by_summary["Initial commit"].parent_ids == ()
+        assert set(by_summary["Rename core"].files_changed) == {
+            "pkg/core.py",
+            "pkg/renamed.py",
+        }
+        for commit in listed:
+            assert commit == converter._convert_commit(git_repo.commit(commit.id))
+
+
+class TestSplitLogRecords:
+    """Test splitting streamed git log output into records."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_split_log_records_across_chunks(self, chunk_size: int) -> None:
+        """Test records are reassembled however the stream is chunked."""
+        records = [
+            b"a" * 40 + b"\0message\x01text\0\nfile.txt\0",
+            b"b" * 40 + b"\0" + b"x" * 10_000,
+        ]
+        data = b"".join(b"\x01" + record for record in records)
+        chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+        assert list(_split_log_records(chunks)) == records
@@ -0,0 +1,42 @@
+"""Tests for import-time behaviour of the package."""
+
+import subprocess
+import sys
+
+
+def loaded_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the modules it loaded."""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    """Tests for deferred imports."""
+
+    def test_cli_import_skips_git_and_textual(self) -> None:
+        """Test importing the CLI does not load GitPython or Textual."""
+        modules = loaded_modules("import git_patchdance.cli")
+
+        assert "git" not in modules
+        assert "textual" not in modules
+
+    def test_core_import_defers_submodules(self) -> None:
+        """Test importing the core package does not load its submodules."""
+        modules = loaded_modules("import git_patchdance.core")
+
+        assert "git_patchdance.core.models" not in modules
+        assert "git_patchdance.core.events" not in modules
+
+    def test_core_reexports_resolve_on_access(self) -> None:
+        """Test re-exported names resolve to the submodule objects."""
+        from git_patchdance import CommitGraph, core
+        from git_patchdance.core import models
+
+        assert core.CommitInfo is models.CommitInfo
+        assert core.GitPatchError.__module__ == "git_patchdance.core.errors"
+        assert CommitGraph is models.CommitGraph
@@ -1,8 +1,12 @@
 """Unit tests for core models."""
 
+import sys
+from dataclasses import FrozenInstanceError
 from datetime import UTC, datetime
 from pathlib import Path
 
+import pytest
+
 from git_patchdance.core.models import (
     CommitGraph,
     CommitId,
@@ -13,32 +17,31 @@ from git_patchdance.core.models import (
     LineType,
     Patch,
     PatchId,
+    parse_hunks,
+    short,
 )
 
 
 class TestCommitId:
-    """Tests for CommitId dataclass."""
+    """Tests for CommitId and its helpers."""
 
     def test_commit_id_short(self) -> None:
         """Test getting short version of commit ID."""
         commit_id = CommitId("a1b2c3d4e5f6789012345678901234567890abcd")
-        assert str(commit_id) == "a1b2c3d4"
+        assert short(commit_id) == "a1b2c3d4"
+        assert short(commit_id) is short(commit_id)
 
     def test_commit_id_short_handles_short_ids(self) -> None:
-        """Test short() method with already short IDs."""
+        """Test short() with already short IDs."""
         commit_id = CommitId("abc123")
-        assert str(commit_id) == "abc123"
+        assert short(commit_id) == "abc123"
 
-    def test_commit_id_full(self) -> None:
-        """Test getting full commit ID."""
+    def test_commit_id_is_plain_string(self) -> None:
+        """Test CommitId carries the full SHA as a plain string."""
         full_sha = "a1b2c3d4e5f6789012345678901234567890abcd"
         commit_id = CommitId(full_sha)
-        assert commit_id.full == full_sha
-
-    def test_commit_id_str_representation(self) -> None:
-        """Test string representation uses short format."""
-        commit_id = CommitId("a1b2c3d4e5f6789012345678901234567890abcd")
-        assert str(commit_id) == "a1b2c3d4"
+        assert commit_id == full_sha
+        assert str(commit_id) == full_sha
 
     def test_commit_id_equality(self) -> None:
         """Test CommitId equality comparison."""
@@ -65,7 +68,7 @@ class TestCommitInfo:
             email="test@example.com",
             timestamp=timestamp,
             parent_ids=(),
-            files_changed=["file1.py", "file2.py"],
+            files_changed=("file1.py", "file2.py"),
         )
 
         assert commit_info.id == commit_id
@@ -74,7 +77,30 @@ class TestCommitInfo:
         assert commit_info.email == "test@example.com"
         assert commit_info.timestamp == timestamp
         assert commit_info.parent_ids == ()
-        assert commit_info.files_changed == ["file1.py", "file2.py"]
+        assert commit_info.files_changed == ("file1.py", "file2.py")
+        assert commit_info.timestamp_epoch == timestamp.timestamp()
+
+    def test_commit_info_interned(self) -> None:
+        """Test interned() shares SHA and identity strings across commits."""
+        parent_sha = "".join(["a1b2c3d4e5f6789012345678901234567890", "abcd"])
+        author = "".join(["Test ", "Author"])
+        path = "/".join(["src", "main.py"])
+
+        commit_info = CommitInfo.interned(
+            id="f" * 40,
+            message="Test commit",
+            author=author,
+            email="test@example.com",
+            timestamp=datetime.now(UTC),
+            parent_ids=[parent_sha],
+            files_changed=[path],
+        )
+
+        assert commit_info.parent_ids == (CommitId(parent_sha),)
+        assert commit_info.parent_ids[0] is sys.intern(parent_sha)
+        assert commit_info.author is sys.intern(author)
+        assert commit_info.files_changed == (path,)
+        assert commit_info.files_changed[0] is sys.intern(path)
 
     def test_commit_info_summary(self) -> None:
         """Test getting commit message summary (first line)."""
@@ -85,10 +111,11 @@ class TestCommitInfo:
             email="test@example.com",
             timestamp=datetime.now(UTC),
             parent_ids=(),
-            files_changed=[],
+            files_changed=(),
         )
 
         assert commit_info.summary() == "First line summary"
+        assert commit_info.summary() is commit_info.summary()
 
     def test_commit_info_summary_empty_message(self) -> None:
         """Test summary with empty message."""
@@ -99,7 +126,7 @@ class TestCommitInfo:
             email="test@example.com",
             timestamp=datetime.now(UTC),
             parent_ids=(),
-            files_changed=[],
+            files_changed=(),
         )
 
         assert commit_info.summary() == ""
@@ -113,7 +140,7 @@ class TestCommitInfo:
             email="test@example.com",
             timestamp=datetime.now(UTC),
             parent_ids=(CommitId("parent123"),),
-            files_changed=[],
+            files_changed=(),
         )
 
         assert not commit_info.is_merge()
@@ -127,11 +154,28 @@ class TestCommitInfo:
             email="test@example.com",
             timestamp=datetime.now(UTC),
             parent_ids=(CommitId("parent1"), CommitId("parent2")),
-            files_changed=[],
+            files_changed=(),
         )
 
         assert commit_info.is_merge()
 
+    def test_commit_info_is_frozen_and_hashable(self) -> None:
+        """Test commit info cannot be mutated and can be used as a key."""
+        commit_info = CommitInfo(
+            id=CommitId("abc123"),
+            message="Frozen commit",
+            author="Test Author",
+            email="test@example.com",
+            timestamp=datetime.now(UTC),
+            parent_ids=(),
+            files_changed=("file.py",),
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            commit_info.message = "Changed"  # type: ignore[misc]
+        assert commit_info.summary() == "Frozen commit"
+        assert {commit_info: 1}[commit_info] == 1
+
 
 class TestDiffLine:
     """Tests for DiffLine dataclass."""
@@ -231,6 +275,86 @@ class TestHunk:
         assert hunk.new.lines == 2
         assert len(hunk.lines) == 3
         assert hunk.context == "function_name"
+        assert hunk.additions == 1
+        assert hunk.deletions == 1
+        assert hunk.context_lines == 1
+
+
+class TestParseHunks:
+    """Tests for parse_hunks."""
+
+    RAW = (
+        "@@ -10,2 +10,3 @@ def function_name():\n"
+        "  context line\n"
+        "- old line\n"
+        "+ new line\n"
+        "+ another line\n"
+        "@@ -40 +41 @@\n"
+        "  single line\n"
+    )
+
+    def test_parse_hunks(self) -> None:
+        """Test parsing headers and diff lines."""
+        hunks = parse_hunks(self.RAW)
+
+        assert len(hunks) == 2
+        assert hunks[0].old == LineRun(start=10, lines=2)
+        assert hunks[0].new == LineRun(start=10, lines=3)
+        assert hunks[0].context == "def function_name():"
+        assert [line.line_type for line in hunks[0].lines] == [
+            LineType.CONTEXT,
+            LineType.DELETION,
+            LineType.ADDITION,
+            LineType.ADDITION,
+        ]
+        assert (hunks[0].additions, hunks[0].deletions) == (2, 1)
+        assert hunks[1].old == LineRun(start=40, lines=1)
+        assert hunks[1].new == LineRun(start=41, lines=1)
+        assert hunks[1].context == ""
+        assert len(hunks[1].lines) == 1
+
+    def test_parse_hunks_metadata_only(self) -> None:
+        """Test metadata-only parsing keeps line runs but skips lines."""
+        hunks = parse_hunks(self.RAW, metadata_only=True)
+
+        assert [(h.old, h.new) for h in hunks] == [
+            (LineRun(start=10, lines=2), LineRun(start=10, lines=3)),
+            (LineRun(start=40, lines=1), LineRun(start=41, lines=1)),
+        ]
+        assert all(h.lines == [] for h in hunks)
+
+    def test_parse_hunks_metadata_only_stats(self) -> None:
+        """Test metadata-only parsing counts lines it does not keep."""
+        full = parse_hunks(self.RAW)
+        metadata = parse_hunks(self.RAW, metadata_only=True)
+
+        stats = [(h.additions, h.deletions, h.context_lines) for h in metadata]
+        assert stats == [(2, 1, 1), (0, 0, 1)]
+        assert stats == [(h.additions, h.deletions, h.context_lines) for h in full]
+
+    def test_parse_hunks_invalid_header(self) -> None:
+        """Test that malformed headers are rejected."""
+        with pytest.raises(ValueError, match="Invalid hunk header"):
+            parse_hunks("@@ -a +b @@\n", metadata_only=True)
+
+    def test_parse_hunks_line_before_header(self) -> None:
+        """Test that diff lines outside a hunk are rejected."""
+        with pytest.raises(ValueError, match="before first hunk header"):
+            parse_hunks("+ stray line\n")
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            pytest.param("+ stray line\n", id="line-before-header"),
+            pytest.param("@@ -1 +1 @@\n?? bad prefix\n", id="bad-prefix"),
+        ],
+    )
+    def test_parse_hunks_metadata_only_validates_lines(self, raw: str) -> None:
+        """Test that metadata-only parsing rejects what full parsing rejects."""
+        with pytest.raises(ValueError):
+            parse_hunks(raw)
+        with pytest.raises(ValueError):
+            parse_hunks(raw, metadata_only=True)
 
 
 class TestPatch:
@@ -279,7 +403,7 @@ class TestCommitGraph:
                 email="test@example.com",
                 timestamp=datetime.now(UTC),
                 parent_ids=(),
-                files_changed=["file1.py"],
+                files_changed=("file1.py",),
             ),
             CommitInfo(
                 id=CommitId("commit2"),
@@ -288,7 +412,7 @@ class TestCommitGraph:
                 email="test@example.com",
                 timestamp=datetime.now(UTC),
                 parent_ids=(CommitId("commit1"),),
-                files_changed=["file2.py"],
+                files_changed=("file2.py",),
             ),
         ]
 
@@ -300,6 +424,8 @@ class TestCommitGraph:
         assert len(commit_graph.commits) == 2
         assert commit_graph.current_branch == "main"
         assert commit_graph.total_count == 2
+        assert commit_graph.short_ids == ["commit1", "commit2"]
+        assert commit_graph.summaries == ["First commit", "Second commit"]
 
     def test_find_commit(self) -> None:
         """Test finding a commit by ID."""
@@ -310,7 +436,7 @@ class TestCommitGraph:
             email="test@example.com",
             timestamp=datetime.now(UTC),
             parent_ids=(),
-            files_changed=[],
+            files_changed=(),
         )
 
         commit_graph = CommitGraph(
@@ -334,7 +460,7 @@ class TestCommitGraph:
                 email="test@example.com",
                 timestamp=datetime.now(UTC),
                 parent_ids=(),
-                files_changed=[],
+                files_changed=(),
             ),
             CommitInfo(
                 id=CommitId("commit2"),
@@ -343,7 +469,7 @@ class TestCommitGraph:
                 email="test@example.com",
                 timestamp=datetime.now(UTC),
                 parent_ids=(),
-                files_changed=[],
+                files_changed=(),
             ),
         ]
 
@@ -355,3 +481,56 @@ class TestCommitGraph:
         assert commit_graph.get_commit_index(CommitId("commit1")) == 0
         assert commit_graph.get_commit_index(CommitId("commit2")) == 1
         assert commit_graph.get_commit_index(CommitId("nonexistent")) is None
+
+    def test_get_commit_index_prefers_first_occurrence(self) -> None:
+        """Test duplicate IDs resolve to the first matching commit."""
+        commits = [
+            CommitInfo(
+                id=CommitId("commit1"),
+                message=f"Commit {i}",
+                author="Test Author",
+                email="test@example.com",
+                timestamp=datetime.now(UTC),
+                parent_ids=(),
+                files_changed=(),
+            )
+            for i in range(2)
+        ]
+
+        commit_graph = CommitGraph(commits=commits, current_branch="main")
+
+        assert commit_graph.get_commit_index(CommitId("commit1")) == 0
+        assert commit_graph.find_commit(CommitId("commit1")) is commits[0]
+
+    def test_is_ancestor(self) -> None:
+        """Test reachability through parents, including merges."""
+
+        def commit(name: str, *parents: str) -> CommitInfo:
+            return CommitInfo(
+                id=CommitId(name),
+                message=name,
+                author="Test Author",
+                email="test@example.com",
+                timestamp=datetime.now(UTC),
+                parent_ids=tuple(CommitId(p) for p in parents),
+                files_changed=(),
+            )
+
+        commit_graph = CommitGraph(
+            commits=[
+                commit("merge", "left", "right"),
+                commit("left", "root"),
+                commit("right", "root"),
+                commit("root", "outside"),
+            ],
+            current_branch="main",
+        )
+        # Parent edges are only built once reachability is queried
+        assert commit_graph._parent_edges is None
+
+        assert commit_graph.is_ancestor(CommitId("root"), CommitId("merge"))
+        assert commit_graph.is_ancestor(CommitId("right"), CommitId("merge"))
+        assert commit_graph.is_ancestor(CommitId("left"), CommitId("left"))
+        assert not commit_graph.is_ancestor(CommitId("left"), CommitId("right"))
+        assert not commit_graph.is_ancestor(CommitId("merge"), CommitId("root"))
+        assert not commit_graph.is_ancestor(CommitId("outside"), CommitId("root"))
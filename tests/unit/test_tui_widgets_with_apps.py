@@ -1,13 +1,28 @@
 """Test TUI widgets using small Textual test apps."""
 
+from dataclasses import replace
 from datetime import datetime
 
 import pytest
 from textual.app import App, ComposeResult
 
-from git_patchdance.core.models import CommitId, CommitInfo
+from git_patchdance.core.models import CommitGraph, CommitId, CommitInfo
 from git_patchdance.tui.app import CommitDetails, CommitList
 
+_THREE_COMMITS = tuple(
+    CommitInfo(
+        id=CommitId(f"commit{i}"),
+        message=f"Commit {i}",
+        author="Author",
+        email="test@example.com",
+        timestamp=datetime(2023, 1, 1),
+        parent_ids=(),
+        files_changed=(),
+    )
+    for i in range(3)
+)
+_THREE_COMMIT_GRAPH = CommitGraph(commits=list(_THREE_COMMITS), current_branch="main")
+
 
 class CommitListValidationApp(App[None]):
     """Test app for CommitList widget."""
@@ -47,11 +62,13 @@ class TestTuiWidgetsWithApps:
                     email="test@example.com",
                     timestamp=datetime.now(),
                     parent_ids=(),
-                    files_changed=["test.py"],
+                    files_changed=("test.py",),
                 )
             ]
 
-            app.commit_list.commits = commits
+            app.commit_list.show_graph(
+                CommitGraph(commits=commits, current_branch="main")
+            )
             await pilot.pause()
 
             assert len(app.commit_list.commits) == 1
@@ -74,7 +91,7 @@ class TestTuiWidgetsWithApps:
                 email="test@example.com",
                 timestamp=datetime(2023, 1, 1, 12, 0, 0),
                 parent_ids=(),
-                files_changed=["test.py"],
+                files_changed=("test.py",),
             )
 
             app.commit_details.show_commit(commit)
@@ -85,6 +102,27 @@ class TestTuiWidgetsWithApps:
             assert "abc123" in content
             assert "Test commit message" in content
 
+            # Switching away and back reuses the formatted details
+            other = replace(commit, id=CommitId("def456"), message="Other")
+            app.commit_details.show_commit(other)
+            app.commit_details.show_commit(commit)
+            await pilot.pause()
+
+            assert str(app.commit_details.renderable) == content
+            assert len(app.commit_details._details) == 2
+
+            # A new graph starts with an empty cache
+            app.commit_details.clear_cache()
+            assert app.commit_details._details == {}
+
+    def test_commit_list_forwards_widget_options(self) -> None:
+        """Test CommitList accepts the standard widget keyword arguments."""
+        commit_list = CommitList(id="commits", classes="panel", disabled=True)
+
+        assert commit_list.id == "commits"
+        assert commit_list.has_class("panel")
+        assert commit_list.disabled
+
     @pytest.mark.asyncio
     async def test_commit_list_empty_state(self) -> None:
         """Test CommitList with no commits."""
@@ -92,7 +130,7 @@ class TestTuiWidgetsWithApps:
 
         async with app.run_test() as pilot:
             # Set empty commits
-            app.commit_list.commits = []
+            app.commit_list.show_graph(CommitGraph(commits=[], current_branch="main"))
             await pilot.pause()
 
             # Should show "No commits found"
@@ -104,20 +142,7 @@ class TestTuiWidgetsWithApps:
         app = CommitListValidationApp()
 
         async with app.run_test() as pilot:
-            commits = [
-                CommitInfo(
-                    id=CommitId(f"commit{i}"),
-                    message=f"Commit {i}",
-                    author="Author",
-                    email="test@example.com",
-                    timestamp=datetime.now(),
-                    parent_ids=(),
-                    files_changed=[],
-                )
-                for i in range(3)
-            ]
-
-            app.commit_list.commits = commits
+            app.commit_list.show_graph(_THREE_COMMIT_GRAPH)
             await pilot.pause()
 
             assert len(app.commit_list.commits) == 3
@@ -136,7 +161,7 @@ class TestTuiWidgetsWithApps:
                 email="complex@example.com",
                 timestamp=datetime(2023, 12, 25, 14, 30, 45),
                 parent_ids=(CommitId("parent1"), CommitId("parent2")),
-                files_changed=["file1.py", "file2.py", "file3.py"],
+                files_changed=("file1.py", "file2.py", "file3.py"),
             )
 
             app.commit_details.show_commit(commit)
@@ -174,7 +199,7 @@ class TestWidgetInteractions:
                     email="author1@example.com",
                     timestamp=datetime.now(),
                     parent_ids=(),
-                    files_changed=["file1.py"],
+                    files_changed=("file1.py",),
                 ),
                 CommitInfo(
                     id=CommitId("commit2"),
@@ -183,11 +208,13 @@ class TestWidgetInteractions:
                     email="author2@example.com",
                     timestamp=datetime.now(),
                     parent_ids=(),
-                    files_changed=["file2.py"],
+                    files_changed=("file2.py",),
                 ),
             ]
 
-            app.commit_list.commits = commits
+            app.commit_list.show_graph(
+                CommitGraph(commits=commits, current_branch="main")
+            )
             await pilot.pause()
 
             # Show first commit in details